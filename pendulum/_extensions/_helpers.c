@@ -403,8 +403,8 @@ PyObject* timestamp(PyObject *self, PyObject *args) {
 
     result = (year - 1970) * 365 + MONTHS_OFFSETS[0][month];
     result += (int) floor((double) (year - 1968) / 4);
-    result -= (year - 1900) / 100;
-    result += (year - 1600) / 400;
+    result -= (int) floor((double) (year - 1900) / 100);
+    result += (int) floor((double) (year - 1600) / 400);
 
     if (_is_leap(year) && month < 3) {
         result -= 1;
@@ -421,11 +421,17 @@ PyObject* timestamp(PyObject *self, PyObject *args) {
     return PyLong_FromSsize_t(result);
 }
 
-PyObject* local_time(PyObject *self, PyObject *args) {
-    double unix_time;
-    int32_t utc_offset;
+void _local_time(
+    double unix_time,
+    int32_t utc_offset,
+    int32_t *year_ptr,
+    int32_t *month_ptr,
+    int32_t *day_ptr,
+    int32_t *hour_ptr,
+    int32_t *minute_ptr,
+    int32_t *second_ptr
+) {
     int32_t year;
-    int32_t microsecond;
     int64_t seconds;
     int32_t leap_year;
     int64_t sec_per_100years;
@@ -434,16 +440,6 @@ PyObject* local_time(PyObject *self, PyObject *args) {
     int32_t month;
     int32_t day;
     int32_t month_offset;
-    int32_t hour;
-    int32_t minute;
-    int32_t second;
-
-    if (!PyArg_ParseTuple(args, "dii", &unix_time, &utc_offset, &microsecond)) {
-        PyErr_SetString(
-            PyExc_ValueError, "Invalid parameters"
-        );
-        return NULL;
-    }
 
     year = EPOCH_YEAR;
     seconds = (int64_t) floor(unix_time);
@@ -508,11 +504,36 @@ PyObject* local_time(PyObject *self, PyObject *args) {
         month -= 1;
     }
 
+    *year_ptr = year;
+    *month_ptr = month;
+    *day_ptr = day;
+
     // Handle hours, minutes and seconds
-    hour = seconds / SECS_PER_HOUR;
+    *hour_ptr = seconds / SECS_PER_HOUR;
     seconds %= SECS_PER_HOUR;
-    minute = seconds / SECS_PER_MIN;
-    second = seconds % SECS_PER_MIN;
+    *minute_ptr = seconds / SECS_PER_MIN;
+    *second_ptr = seconds % SECS_PER_MIN;
+}
+
+PyObject* local_time(PyObject *self, PyObject *args) {
+    double unix_time;
+    int32_t utc_offset;
+    int32_t year;
+    int32_t microsecond;
+    int32_t month;
+    int32_t day;
+    int32_t hour;
+    int32_t minute;
+    int32_t second;
+
+    if (!PyArg_ParseTuple(args, "dii", &unix_time, &utc_offset, &microsecond)) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
+        );
+        return NULL;
+    }
+
+    _local_time(unix_time, utc_offset, &year, &month, &day, &hour, &minute, &second);
 
     return Py_BuildValue("NNNNNNN",
         PyLong_FromLong(year),
@@ -525,6 +546,75 @@ PyObject* local_time(PyObject *self, PyObject *args) {
     );
 }
 
+PyObject* local_datetime(PyObject *self, PyObject *args) {
+    PyObject *cls;
+    double unix_time;
+    int32_t utc_offset;
+    int32_t microsecond;
+    PyObject *tzinfo = Py_None;
+    PyObject *fold = Py_None;
+    int32_t year;
+    int32_t month;
+    int32_t day;
+    int32_t hour;
+    int32_t minute;
+    int32_t second;
+    PyObject *dt_args;
+    PyObject *dt_kwargs;
+    PyObject *result;
+
+    if (!PyArg_ParseTuple(args, "Odii|OO", &cls, &unix_time, &utc_offset, &microsecond, &tzinfo, &fold)) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
+        );
+        return NULL;
+    }
+
+    _local_time(unix_time, utc_offset, &year, &month, &day, &hour, &minute, &second);
+
+    // datetime and subclasses which do not override __new__
+    // can be created directly without going through a call.
+    if (PyType_Check(cls)
+        && PyType_IsSubtype((PyTypeObject *) cls, PyDateTimeAPI->DateTimeType)
+        && ((PyTypeObject *) cls)->tp_new == PyDateTimeAPI->DateTimeType->tp_new
+        && ((PyTypeObject *) cls)->tp_init == PyBaseObject_Type.tp_init) {
+#if PY_VERSION_HEX >= 0x03060000
+        if (fold != Py_None) {
+            return PyDateTimeAPI->DateTime_FromDateAndTimeAndFold(
+                year, month, day, hour, minute, second, microsecond,
+                tzinfo, PyObject_IsTrue(fold), (PyTypeObject *) cls
+            );
+        }
+#endif
+
+        return PyDateTimeAPI->DateTime_FromDateAndTime(
+            year, month, day, hour, minute, second, microsecond,
+            tzinfo, (PyTypeObject *) cls
+        );
+    }
+
+    dt_args = Py_BuildValue("iiiiiii", year, month, day, hour, minute, second, microsecond);
+    if (dt_args == NULL) {
+        return NULL;
+    }
+
+    dt_kwargs = PyDict_New();
+    if (dt_kwargs == NULL
+        || PyDict_SetItemString(dt_kwargs, "tzinfo", tzinfo) < 0
+        || (fold != Py_None && PyDict_SetItemString(dt_kwargs, "fold", fold) < 0)) {
+        Py_DECREF(dt_args);
+        Py_XDECREF(dt_kwargs);
+        return NULL;
+    }
+
+    result = PyObject_Call(cls, dt_args, dt_kwargs);
+
+    Py_DECREF(dt_args);
+    Py_DECREF(dt_kwargs);
+
+    return result;
+}
+
 
 // Calculate a precise difference between two datetimes.
 PyObject* precise_diff(PyObject *self, PyObject *args) {
@@ -870,6 +960,12 @@ static PyMethodDef helpers_methods[] = {
         METH_VARARGS,
         PyDoc_STR("Returns a UNIX time as a broken down time for a particular transition type.")
     },
+    {
+        "local_datetime",
+        (PyCFunction) local_datetime,
+        METH_VARARGS,
+        PyDoc_STR("Returns a UNIX time as a datetime of the given class for a particular transition type.")
+    },
     {
         "precise_diff",
         (PyCFunction) precise_diff,
@@ -21,6 +21,9 @@ from ..constants import TM_DECEMBER
 from ..constants import TM_JANUARY
 
 
+_DT = typing.TypeVar("_DT", bound=datetime.datetime)
+
+
 class PreciseDiff(
     namedtuple(
         "PreciseDiff",
@@ -183,6 +186,39 @@ def local_time(
     return (year, month, day, hour, minute, second, microseconds)
 
 
+# Broken down local times indexed by their timestamp.
+# Conversions tend to hit the same seconds over and over
+# so this avoids recomputing the date and time fields each time.
+_LOCAL_TIME_CACHE_SIZE = 4096
+_local_time_cache = {}
+
+
+def local_datetime(
+    cls, unix_time, utc_offset, microseconds, tzinfo=None, fold=None
+):  # type: (typing.Type[_DT], int, int, int, typing.Optional[datetime.tzinfo], typing.Optional[int]) -> _DT
+    """
+    Returns a UNIX time as an instance of the given datetime class
+    for a particular transition type.
+
+    The fold attribute is only set if fold is not None.
+    """
+    seconds = int(math.floor(unix_time)) + utc_offset
+
+    fields = _local_time_cache.get(seconds)
+    if fields is None:
+        fields = local_time(seconds, 0, 0)[:6]
+
+        if len(_local_time_cache) >= _LOCAL_TIME_CACHE_SIZE:
+            _local_time_cache.clear()
+
+        _local_time_cache[seconds] = fields
+
+    if fold is None:
+        return cls(*fields, microsecond=microseconds, tzinfo=tzinfo)
+
+    return cls(*fields, microsecond=microseconds, tzinfo=tzinfo, fold=fold)
+
+
 def precise_diff(
     d1, d2
 ):  # type: (typing.Union[datetime.datetime, datetime.date], typing.Union[datetime.datetime, datetime.date]) -> PreciseDiff
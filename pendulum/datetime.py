@@ -32,6 +32,7 @@ from .date import Date
 from .exceptions import PendulumException
 from .helpers import add_duration
 from .helpers import timestamp
+from .helpers import utc_timestamp
 from .period import Period
 from .time import Time
 from .tz import UTC
@@ -189,27 +190,13 @@ class DateTime(datetime.datetime, Date):
 
     @property
     def int_timestamp(self):
-        # Workaround needed to avoid inaccuracy
-        # for far into the future datetimes
-        kwargs = {"tzinfo": self.tzinfo}
+        # Computed from the fields rather than from float_timestamp
+        # to avoid inaccuracy for far into the future datetimes
+        offset = self.utcoffset()
+        if offset is None:
+            raise TypeError("can't subtract offset-naive and offset-aware datetimes")
 
-        if _HAS_FOLD:
-            kwargs["fold"] = self.fold
-
-        dt = datetime.datetime(
-            self.year,
-            self.month,
-            self.day,
-            self.hour,
-            self.minute,
-            self.second,
-            self.microsecond,
-            **kwargs
-        )
-
-        delta = dt - self._EPOCH
-
-        return delta.days * SECONDS_PER_DAY + delta.seconds
+        return utc_timestamp(self, offset)
 
     @property
     def offset(self):
@@ -253,7 +240,9 @@ class DateTime(datetime.datetime, Date):
         return self.dst() != datetime.timedelta()
 
     def get_offset(self):
-        return int(self.utcoffset().total_seconds())
+        offset = self.utcoffset()
+
+        return offset.days * SECONDS_PER_DAY + offset.seconds
 
     def date(self):
         return Date(self.year, self.month, self.day)
@@ -7,6 +7,8 @@ import typing
 
 import pendulum
 
+from pendulum.constants import SECONDS_PER_DAY
+from pendulum.constants import SECONDS_PER_MINUTE
 from pendulum.locales.locale import Locale
 from pendulum.utils._compat import decode
 
@@ -299,14 +301,14 @@ class Formatter:
 
             separator = ":" if token == "Z" else ""
             offset = dt.utcoffset() or datetime.timedelta()
-            minutes = offset.total_seconds() / 60
+            seconds = offset.days * SECONDS_PER_DAY + offset.seconds
 
-            if minutes >= 0:
+            if seconds >= 0:
                 sign = "+"
             else:
                 sign = "-"
 
-            hour, minute = divmod(abs(int(minutes)), 60)
+            hour, minute = divmod(abs(seconds) // SECONDS_PER_MINUTE, 60)
 
             return "{}{:02d}{}{:02d}".format(sign, hour, separator, minute)
 
@@ -17,6 +17,7 @@ from typing import overload
 import pendulum
 
 from .constants import DAYS_PER_MONTHS
+from .constants import SECONDS_PER_DAY
 from .formatting.difference_formatter import DifferenceFormatter
 from .locales.locale import Locale
 
@@ -35,6 +36,7 @@ try:
         raise ImportError()
 
     from ._extensions._helpers import local_time
+    from ._extensions._helpers import local_datetime
     from ._extensions._helpers import precise_diff
     from ._extensions._helpers import is_leap
     from ._extensions._helpers import is_long_year
@@ -43,6 +45,7 @@ try:
     from ._extensions._helpers import timestamp
 except ImportError:
     from ._extensions.helpers import local_time  # noqa
+    from ._extensions.helpers import local_datetime  # noqa
     from ._extensions.helpers import precise_diff  # noqa
     from ._extensions.helpers import is_leap  # noqa
     from ._extensions.helpers import is_long_year  # noqa
@@ -159,6 +162,20 @@ def add_duration(
     )
 
 
+def utc_timestamp(dt, offset):  # type: (datetime, timedelta) -> int
+    """
+    Returns the integer timestamp of a datetime's fields at the given UTC offset.
+
+    Equivalent to timestamp(dt - offset) without building
+    an intermediate datetime.
+    """
+    stamp = timestamp(dt) - offset.days * SECONDS_PER_DAY - offset.seconds
+    if dt.microsecond < offset.microseconds:
+        stamp -= 1
+
+    return stamp
+
+
 def format_diff(
     diff, is_now=True, absolute=False, locale=None
 ):  # type: (Period, bool, bool, Optional[str]) -> str
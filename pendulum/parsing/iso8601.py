@@ -12,8 +12,8 @@ from ..helpers import days_in_year
 from ..helpers import is_leap
 from ..helpers import is_long_year
 from ..helpers import week_day
+from ..tz import fixed_timezone
 from ..tz.timezone import UTC
-from ..tz.timezone import FixedTimezone
 from .exceptions import ParserError
 
 
@@ -249,7 +249,7 @@ def parse_iso8601(text):
                 if negative:
                     offset = -1 * offset
 
-                tzinfo = FixedTimezone(offset)
+                tzinfo = fixed_timezone(offset)
 
         if is_time:
             return datetime.time(hour, minute, second, microsecond)
@@ -31,11 +31,10 @@ def timezone(name, extended=True):  # type: (Union[str, int], bool) -> _Timezone
     if name.lower() == "utc":
         return UTC
 
-    if name in _tz_cache:
-        return _tz_cache[name]
-
-    tz = _Timezone(name, extended=extended)
-    _tz_cache[name] = tz
+    tz = _tz_cache.get(name)
+    if tz is None:
+        tz = _Timezone(name, extended=extended)
+        _tz_cache[name] = tz
 
     return tz
 
@@ -44,13 +43,12 @@ def fixed_timezone(offset):  # type: (int) -> _FixedTimezone
     """
     Return a Timezone instance given its offset in seconds.
     """
-    if offset in _tz_cache:
-        return _tz_cache[offset]  # type: ignore
-
-    tz = _FixedTimezone(offset)
-    _tz_cache[offset] = tz
+    tz = _tz_cache.get(offset)
+    if tz is None:
+        tz = _FixedTimezone(offset)
+        _tz_cache[offset] = tz
 
-    return tz
+    return tz  # type: ignore
 
 
 def local_timezone():  # type: () -> _Timezone
@@ -1,14 +1,20 @@
+from bisect import bisect_right
 from datetime import datetime
 from datetime import timedelta
 from datetime import tzinfo
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import TypeVar
 from typing import overload
 
 import pendulum
 
-from pendulum.helpers import local_time
+from pendulum.constants import SECS_PER_HOUR
+from pendulum.constants import SECS_PER_MIN
+from pendulum.helpers import local_datetime
 from pendulum.helpers import timestamp
+from pendulum.helpers import utc_timestamp
 from pendulum.utils._compat import _HAS_FOLD
 
 from .exceptions import AmbiguousTime
@@ -25,6 +31,10 @@ TRANSITION_ERROR = "error"
 _datetime = datetime
 _D = TypeVar("_D", bound=datetime)
 
+_ZERO_DELTA = timedelta()
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
+
 
 class Timezone(tzinfo):
     """
@@ -36,13 +46,52 @@ class Timezone(tzinfo):
     >>> tz = Timezone('Europe/Paris')
     """
 
+    __slots__ = (
+        "_name",
+        "_transitions",
+        "_hint",
+        "_transitions_to",
+        "_transitions_at",
+        "_transitions_offset",
+        "_transitions_is_dst",
+        "_last_transition",
+        "_last_to",
+        "_last_at",
+        "_dst_deltas",
+    )
+
     def __init__(self, name, extended=True):  # type: (str, bool) -> None
         tz = read(name, extend=extended)
 
         self._name = name
-        self._transitions = tz.transitions
+        self._set_transitions(tz.transitions)
+
+    def _set_transitions(self, transitions):  # type: (List[Transition]) -> None
+        self._transitions = transitions
         self._hint = {True: None, False: None}
 
+        # Flat lists of the bounds used by the transition lookup
+        # so that bisecting does not go through the properties
+        # of every visited transition.
+        self._transitions_to = [t.to for t in transitions]
+        self._transitions_at = [t.at for t in transitions]
+
+        # Same for the transition types, indexed like the transitions.
+        self._transitions_offset = [t.ttype.offset for t in transitions]
+        self._transitions_is_dst = [t.ttype.is_dst() for t in transitions]
+
+        # Most timezones have no more transitions in the foreseeable
+        # future so stamps after the last one are checked up front.
+        self._last_transition = transitions[-1]
+        self._last_to = self._last_transition.to
+        self._last_at = self._last_transition.at
+
+        # A timezone only has a handful of distinct DST amounts
+        # so the corresponding timedeltas are shared.
+        self._dst_deltas = {
+            t.fix: timedelta(seconds=t.fix) for t in transitions if t.ttype.is_dst()
+        }
+
     @property
     def name(self):  # type: () -> str
         return self._name
@@ -73,6 +122,44 @@ class Timezone(tzinfo):
 
         return self._convert(dt)
 
+    def offsets(self, stamps):  # type: (Iterable[int]) -> List[int]
+        """
+        Return the UTC offsets, in seconds, in effect at the given UTC timestamps.
+
+        This is cheaper than converting each timestamp
+        when only the offsets are needed.
+
+        >>> from pendulum import timezone
+        >>> paris = timezone('Europe/Paris')
+        >>> paris.offsets([1356998400, 1372636800])
+        [3600, 7200]
+        """
+        bounds = self._transitions_at
+        offsets = self._transitions_offset
+        result = []
+
+        # Timestamps in a batch tend to be close to each other
+        # so the interval of the last match is checked before bisecting.
+        start = end = offset = 0
+        for stamp in stamps:
+            if not start <= stamp < end:
+                idx = bisect_right(bounds, stamp)
+                if idx:
+                    start = bounds[idx - 1]
+                    offset = offsets[idx - 1]
+                else:
+                    start = _NEG_INF
+                    offset = offsets[0]
+
+                if idx < len(bounds):
+                    end = bounds[idx]
+                else:
+                    end = _POS_INF
+
+            result.append(offset)
+
+        return result
+
     def datetime(
         self, year, month, day, hour=0, minute=0, second=0, microsecond=0
     ):  # type: (int, int, int, int, int, int, int) -> _datetime
@@ -102,19 +189,25 @@ class Timezone(tzinfo):
             if dt.fold == 1:
                 dst_rule = POST_TRANSITION
 
-        if sec < transition.local:
-            if transition.is_ambiguous(sec):
-                # Ambiguous time
+        # The looked up transition is the first one for which
+        # sec < transition.to, so the time can only be skipped by it
+        # or repeated by it or by the previous one.
+        if sec >= transition.local:
+            if transition.is_missing(sec):
+                # Skipped time
                 if dst_rule == TRANSITION_ERROR:
-                    raise AmbiguousTime(dt)
+                    raise NonExistingTime(dt)
 
-                # We set the fold attribute for later
+                # We adjust accordingly
                 if dst_rule == POST_TRANSITION:
+                    sec += transition.fix
                     fold = 1
-            elif transition.previous is not None:
+                else:
+                    sec -= transition.fix
+        else:
+            if not transition.is_ambiguous(sec) and transition.previous is not None:
                 transition = transition.previous
 
-        if transition:
             if transition.is_ambiguous(sec):
                 # Ambiguous time
                 if dst_rule == TRANSITION_ERROR:
@@ -123,68 +216,73 @@ class Timezone(tzinfo):
                 # We set the fold attribute for later
                 if dst_rule == POST_TRANSITION:
                     fold = 1
-            elif transition.is_missing(sec):
-                # Skipped time
-                if dst_rule == TRANSITION_ERROR:
-                    raise NonExistingTime(dt)
-
-                # We adjust accordingly
-                if dst_rule == POST_TRANSITION:
-                    sec += transition.fix
-                    fold = 1
-                else:
-                    sec -= transition.fix
 
-        kwargs = {"tzinfo": self}
-        if _HAS_FOLD or isinstance(dt, pendulum.DateTime):
-            kwargs["fold"] = fold
+        if not _HAS_FOLD and not isinstance(dt, pendulum.DateTime):
+            fold = None
 
-        return dt.__class__(*local_time(sec, 0, dt.microsecond), **kwargs)
+        return local_datetime(dt.__class__, sec, 0, dt.microsecond, self, fold)
 
     def _convert(self, dt):  # type: (_D) -> _D
-        if dt.tzinfo is self:
-            return self._normalize(dt, dst_rule=POST_TRANSITION)
+        tz = dt.tzinfo
 
-        if not isinstance(dt.tzinfo, Timezone):
+        # Converting from UTC is the most common case and needs no offset.
+        # This is an identity check on purpose: other UTC timezones
+        # go through the generic paths below.
+        if tz is UTC:
+            stamp = timestamp(dt)
+        elif tz is self:
+            return self._normalize(dt, dst_rule=POST_TRANSITION)
+        elif not isinstance(tz, Timezone):
             return dt.astimezone(self)
-
-        stamp = timestamp(dt)
-
-        if isinstance(dt.tzinfo, FixedTimezone):
-            offset = dt.tzinfo.offset
         else:
-            transition = dt.tzinfo._lookup_transition(stamp)
-            offset = transition.ttype.offset
-
-            if stamp < transition.local and transition.previous is not None:
-                if (
-                    transition.previous.is_ambiguous(stamp)
-                    and getattr(dt, "fold", 1) == 0
-                ):
-                    pass
-                else:
-                    offset = transition.previous.ttype.offset
+            stamp = timestamp(dt)
 
-        stamp -= offset
+            if isinstance(tz, FixedTimezone):
+                offset = tz.offset
+            else:
+                transition = tz._lookup_transition(stamp)
+                offset = transition.ttype.offset
 
-        transition = self._lookup_transition(stamp, is_utc=True)
-        if stamp < transition.at and transition.previous is not None:
-            transition = transition.previous
+                if stamp < transition.local and transition.previous is not None:
+                    if (
+                        transition.previous.is_ambiguous(stamp)
+                        and getattr(dt, "fold", 1) == 0
+                    ):
+                        pass
+                    else:
+                        offset = transition.previous.ttype.offset
 
-        offset = transition.ttype.offset
-        stamp += offset
-        fold = int(not transition.ttype.is_dst())
+            stamp -= offset
 
-        kwargs = {"tzinfo": self}
+        idx = self._utc_transition_index(stamp)
 
+        fold = None
         if _HAS_FOLD or isinstance(dt, pendulum.DateTime):
-            kwargs["fold"] = fold
-
-        return dt.__class__(*local_time(stamp, 0, dt.microsecond), **kwargs)
+            fold = int(not self._transitions_is_dst[idx])
+
+        return local_datetime(
+            dt.__class__,
+            stamp,
+            self._transitions_offset[idx],
+            dt.microsecond,
+            self,
+            fold,
+        )
 
     def _lookup_transition(
         self, stamp, is_utc=False
     ):  # type: (int, bool) -> Transition
+        if is_utc:
+            bounds = self._transitions_at
+            last_bound = self._last_at
+        else:
+            bounds = self._transitions_to
+            last_bound = self._last_to
+
+        if stamp >= last_bound:
+            # Beyond last transition
+            return self._last_transition
+
         lo, hi = 0, len(self._transitions)
         hint = self._hint[is_utc]
         if hint:
@@ -195,29 +293,22 @@ class Timezone(tzinfo):
             else:
                 lo = hint[1]
 
-        if not is_utc:
-            while lo < hi:
-                mid = (lo + hi) // 2
-                if stamp < self._transitions[mid].to:
-                    hi = mid
-                else:
-                    lo = mid + 1
-        else:
-            while lo < hi:
-                mid = (lo + hi) // 2
-                if stamp < self._transitions[mid].at:
-                    hi = mid
-                else:
-                    lo = mid + 1
-
-        if lo >= len(self._transitions):
-            # Beyond last transition
-            lo = len(self._transitions) - 1
+        lo = bisect_right(bounds, stamp, lo, hi)
 
         self._hint[is_utc] = (stamp, lo)
 
         return self._transitions[lo]
 
+    def _utc_transition_index(self, stamp):  # type: (int) -> int
+        # The transition in effect at a UTC timestamp is the last one
+        # at or before it, or the first one for earlier timestamps.
+        if stamp >= self._last_at:
+            return len(self._transitions_at) - 1
+
+        idx = bisect_right(self._transitions_at, stamp) - 1
+
+        return idx if idx >= 0 else 0
+
     @overload
     def utcoffset(self, dt):  # type: (None) -> None
         pass
@@ -243,9 +334,9 @@ class Timezone(tzinfo):
         transition = self._get_transition(dt)
 
         if not transition.ttype.is_dst():
-            return timedelta()
+            return _ZERO_DELTA
 
-        return timedelta(seconds=transition.fix)
+        return self._dst_deltas[transition.fix]
 
     def tzname(self, dt):  # type: (Optional[_datetime]) -> Optional[str]
         if dt is None:
@@ -257,11 +348,8 @@ class Timezone(tzinfo):
 
     def _get_transition(self, dt):  # type: (_datetime) -> Transition
         if dt.tzinfo is not None and dt.tzinfo is not self:
-            dt = dt - dt.utcoffset()
-
-            stamp = timestamp(dt)
-
-            transition = self._lookup_transition(stamp, is_utc=True)
+            stamp = utc_timestamp(dt, dt.utcoffset())
+            transition = self._transitions[self._utc_transition_index(stamp)]
         else:
             stamp = timestamp(dt)
 
@@ -282,13 +370,11 @@ class Timezone(tzinfo):
     def fromutc(self, dt):  # type: (_D) -> _D
         stamp = timestamp(dt)
 
-        transition = self._lookup_transition(stamp, is_utc=True)
-        if stamp < transition.at and transition.previous is not None:
-            transition = transition.previous
+        idx = self._utc_transition_index(stamp)
 
-        stamp += transition.ttype.offset
-
-        return dt.__class__(*local_time(stamp, 0, dt.microsecond), tzinfo=self)
+        return local_datetime(
+            dt.__class__, stamp, self._transitions_offset[idx], dt.microsecond, self
+        )
 
     def __repr__(self):  # type: () -> str
         return "Timezone('{}')".format(self._name)
@@ -298,11 +384,14 @@ class Timezone(tzinfo):
 
 
 class FixedTimezone(Timezone):
+
+    __slots__ = ("_offset", "_utcoffset")
+
     def __init__(self, offset, name=None):
         sign = "-" if offset < 0 else "+"
 
-        minutes = offset / 60
-        hour, minute = divmod(abs(int(minutes)), 60)
+        hour, seconds = divmod(abs(int(offset)), SECS_PER_HOUR)
+        minute = seconds // SECS_PER_MIN
 
         if not name:
             name = "{0}{1:02d}:{2:02d}".format(sign, hour, minute)
@@ -315,6 +404,17 @@ class FixedTimezone(Timezone):
     def offset(self):  # type: () -> int
         return self._offset
 
+    def offsets(self, stamps):  # type: (Iterable[int]) -> List[int]
+        return [self._offset for _ in stamps]
+
+    def convert(self, dt, dst_rule=None):  # type: (_D, Optional[str]) -> _D
+        # Datetimes already in this timezone, typically UTC ones,
+        # are returned as is.
+        if dt.tzinfo is self:
+            return dt
+
+        return super(FixedTimezone, self).convert(dt, dst_rule=dst_rule)
+
     def _normalize(self, dt, dst_rule=None):  # type: (_D, Optional[str]) -> _D
         if _HAS_FOLD:
             dt = dt.__class__(
@@ -352,7 +452,7 @@ class FixedTimezone(Timezone):
         return self._utcoffset
 
     def dst(self, dt):  # type: (Optional[_datetime]) -> timedelta
-        return timedelta()
+        return _ZERO_DELTA
 
     def fromutc(self, dt):  # type: (_D) -> _D
         # Use the stdlib datetime's add method to avoid infinite recursion
@@ -366,12 +466,14 @@ class FixedTimezone(Timezone):
 
 
 class TimezoneFile(Timezone):
+
+    __slots__ = ()
+
     def __init__(self, path):
         tz = read_file(path)
 
         self._name = ""
-        self._transitions = tz.transitions
-        self._hint = {True: None, False: None}
+        self._set_transitions(tz.transitions)
 
 
 UTC = FixedTimezone(0, "UTC")
@@ -95,6 +95,16 @@ def test_int_timestamp_accuracy():
     assert d.int_timestamp == 32527311790
 
 
+@pytest.mark.skipif(
+    struct.calcsize("P") * 8 == 32, reason="Test only available for 64bit systems"
+)
+def test_int_timestamp_before_1900():
+    assert pendulum.datetime(1846, 4, 9, 4, 19, 8).int_timestamp == -3904573252
+    assert pendulum.datetime(1801, 2, 28, 23, 59, 59).int_timestamp == -5328028801
+    assert pendulum.datetime(1500, 3, 1).int_timestamp == -14826672000
+    assert pendulum.datetime(100, 1, 1).int_timestamp == -59011459200
+
+
 def test_timestamp_with_transition():
     d_pre = pendulum.datetime(
         2012, 10, 28, 2, 0, tz="Europe/Warsaw", dst_rule=pendulum.PRE_TRANSITION
@@ -8,6 +8,7 @@ import pytz
 
 from pendulum import timezone
 from pendulum.helpers import days_in_year
+from pendulum.helpers import local_datetime
 from pendulum.helpers import precise_diff
 from pendulum.helpers import week_day
 
@@ -124,6 +125,24 @@ def test_days_in_years():
     assert 366 == days_in_year(2016)
 
 
+def test_local_datetime():
+    tz = timezone("Europe/Paris")
+
+    dt = local_datetime(datetime, 1372636800, 7200, 123456, tz)
+    assert type(dt) is datetime
+    assert_datetime(dt, 2013, 7, 1, 2, 0, 0, 123456)
+    assert dt.tzinfo is tz
+
+    dt = local_datetime(pendulum.DateTime, 1383438600, -18000, 0, tz, 1)
+    assert isinstance(dt, pendulum.DateTime)
+    assert_datetime(dt, 2013, 11, 2, 19, 30, 0, 0)
+    assert dt.fold == 1
+
+    dt = local_datetime(pendulum.DateTime, -1, 0, 0)
+    assert_datetime(dt, 1969, 12, 31, 23, 59, 59, 0)
+    assert dt.tzinfo is None
+
+
 def test_test_now():
     now = pendulum.datetime(2000, 11, 10, 12, 34, 56, 123456)
     pendulum.set_test_now(now)
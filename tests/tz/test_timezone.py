@@ -312,6 +312,18 @@ def test_utcoffset_pre_transition():
     assert utcoffset == timedelta(days=-1, seconds=64800)
 
 
+def test_utcoffset_of_pendulum_datetime_after_dst_transition():
+    tz = pendulum.timezone("Africa/Ceuta")
+    paris = pendulum.timezone("Europe/Paris")
+    dt = pendulum.datetime(2013, 3, 31, 3, 0, tz=paris)
+    plain = datetime(2013, 3, 31, 3, 0, tzinfo=paris)
+
+    assert tz.utcoffset(dt) == timedelta(hours=2)
+    assert tz.dst(dt) == timedelta(hours=1)
+    assert tz.utcoffset(plain) == timedelta(hours=2)
+    assert tz.dst(plain) == timedelta(hours=1)
+
+
 def test_dst():
     tz = pendulum.timezone("Europe/Amsterdam")
     dst = tz.dst(datetime(1940, 7, 1))
@@ -362,6 +374,20 @@ def test_after_last_transition():
     assert dt.microsecond == 0
 
 
+def test_after_last_transition_without_dst():
+    tz = pendulum.timezone("Asia/Tokyo")
+    dt = tz.convert(pendulum.datetime(2016, 6, 1, 12, 34, 56))
+
+    assert_datetime(dt, 2016, 6, 1, 21, 34, 56)
+    assert dt.utcoffset().total_seconds() == 32400
+    assert dt.dst() == timedelta()
+
+    dt = tz.convert(pendulum.naive(2016, 6, 1, 21, 34, 56))
+
+    assert_datetime(dt, 2016, 6, 1, 21, 34, 56)
+    assert dt.utcoffset().total_seconds() == 32400
+
+
 def test_on_last_transition():
     tz = pendulum.timezone("Europe/Paris")
     dt = pendulum.naive(2037, 10, 25, 2, 30)
@@ -389,6 +415,20 @@ def test_on_last_transition():
     assert dt.utcoffset().total_seconds() == 7200
 
 
+def test_convert_same_second_keeps_microseconds():
+    tz = pendulum.timezone("Europe/Paris")
+    utc = pendulum.datetime(2016, 6, 1, 10, 34, 56, 123456)
+
+    dt = tz.convert(utc)
+    assert_datetime(dt, 2016, 6, 1, 12, 34, 56, 123456)
+
+    dt = tz.convert(utc.replace(microsecond=654321))
+    assert_datetime(dt, 2016, 6, 1, 12, 34, 56, 654321)
+
+    dt = tz.convert(pendulum.naive(2016, 6, 1, 12, 34, 56, 42))
+    assert_datetime(dt, 2016, 6, 1, 12, 34, 56, 42)
+
+
 @pytest.mark.skipif(not PY36, reason="fold attribute only present in Python 3.6+")
 def test_convert_fold_attribute_is_honored():
     tz = pendulum.timezone("US/Eastern")
@@ -497,6 +537,47 @@ def test_fixed_timezone():
     assert tz2.dst(dt) == timedelta()
 
 
+def test_offsets():
+    tz = pendulum.timezone("Europe/Paris")
+    stamps = [
+        pendulum.datetime(2013, 1, 1).int_timestamp,
+        pendulum.datetime(2013, 7, 1).int_timestamp,
+        # Around the 2013-03-31T01:00:00+00:00 spring forward
+        pendulum.datetime(2013, 3, 31, 0, 59, 59).int_timestamp,
+        pendulum.datetime(2013, 3, 31, 1).int_timestamp,
+        # Before the first and after the last transition
+        pendulum.datetime(1800, 1, 1).int_timestamp,
+        pendulum.datetime(2200, 7, 1).int_timestamp,
+    ]
+
+    assert tz.offsets(stamps) == [
+        tz.convert(pendulum.from_timestamp(stamp)).offset for stamp in stamps
+    ]
+    assert tz.offsets(stamps)[:4] == [3600, 7200, 3600, 7200]
+
+
+def test_offsets_of_consecutive_timestamps():
+    tz = pendulum.timezone("Europe/Paris")
+    # 2013-03-31T01:00:00+00:00 is the Paris spring forward
+    start = pendulum.datetime(2013, 3, 31, 0, 59, 58).int_timestamp
+    stamps = list(range(start, start + 4)) + list(range(start + 3, start - 1, -1))
+
+    assert tz.offsets(stamps) == [3600, 3600, 7200, 7200, 7200, 7200, 3600, 3600]
+
+
+def test_fixed_timezone_name():
+    assert fixed_timezone(19800).name == "+05:30"
+    assert fixed_timezone(-19800).name == "-05:30"
+    assert fixed_timezone(-90).name == "-00:01"
+    assert fixed_timezone(0).name == "+00:00"
+
+
+def test_fixed_timezone_offsets():
+    tz = fixed_timezone(19800)
+
+    assert tz.offsets([0, 1372636800]) == [19800, 19800]
+
+
 def test_just_before_last_transition():
     tz = pendulum.timezone("Asia/Shanghai")
     dt = datetime(1991, 4, 20, 1, 49, 8)